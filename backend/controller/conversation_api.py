@@ -25,7 +25,7 @@ from ..dao.workflow_table import save_workflow_data, get_workflow_data_by_id, up
 from ..service.mcp_client import comfyui_agent_invoke
 from ..utils.request_context import set_request_context, get_session_id
 from ..utils.logger import log
-from ..utils.modelscope_gateway import ModelScopeGateway
+from ..utils.modelscope_gateway import get_modelscope_gateway
 import folder_paths
 
 
@@ -92,7 +92,8 @@ class DownloadProgressCallback:
         self.progress = 0
         self.status = "downloading"  # downloading, completed, failed
         self.error_message = None
-        self.start_time = time.time()
+        self.start_time = time.time()  # 墙钟时间，仅用于展示
+        self._start_monotonic = time.monotonic()  # 单调时钟，用于计算耗时
         
         # 初始化进度记录
         with download_lock:
@@ -112,8 +113,7 @@ class DownloadProgressCallback:
     def update(self, size: int):
         """更新下载进度"""
         self.progress += size
-        current_time = time.time()
-        elapsed_time = current_time - self.start_time
+        elapsed_time = time.monotonic() - self._start_monotonic
         
         # 计算下载速度和预估时间
         if elapsed_time > 0:
@@ -141,8 +141,7 @@ class DownloadProgressCallback:
 
     def end(self, success: bool = True, error_message: str = None):
         """下载结束回调"""
-        current_time = time.time()
-        total_time = current_time - self.start_time
+        total_time = time.monotonic() - self._start_monotonic
         
         if success:
             self.status = "completed"
@@ -400,7 +399,8 @@ async def save_workflow_checkpoint(request):
         else:
             attributes["description"] = f"Workflow checkpoint: {checkpoint_type}"
         
-        version_id = save_workflow_data(
+        version_id = await asyncio.to_thread(
+            save_workflow_data,
             session_id=session_id,
             workflow_data=workflow_api,
             workflow_data_ui=workflow_ui,
@@ -460,8 +460,8 @@ async def restore_workflow_checkpoint(request):
                 "message": "Invalid version_id format"
             })
         
-        # Get workflow data by version ID
-        workflow_version = get_workflow_data_by_id(version_id)
+        # Get workflow data by version ID (sqlite I/O runs off the event loop)
+        workflow_version = await asyncio.to_thread(get_workflow_data_by_id, version_id)
         
         if not workflow_version:
             return web.json_response({
@@ -629,7 +629,8 @@ async def invoke_debug(request):
         if workflow_data and accumulated_text:
             try:
                 current_session_id = get_session_id()
-                checkpoint_id = save_workflow_data(
+                checkpoint_id = await asyncio.to_thread(
+                    save_workflow_data,
                     session_id=current_session_id,
                     workflow_data=workflow_data,
                     workflow_data_ui=None,  # UI format not available in debug agent
@@ -711,7 +712,7 @@ async def update_workflow_ui(request):
             })
         
         # Update only the workflow_data_ui field
-        success = update_workflow_ui_by_id(checkpoint_id, workflow_data_ui)
+        success = await asyncio.to_thread(update_workflow_ui_by_id, checkpoint_id, workflow_data_ui)
         
         if success:
             log.info(f"Successfully updated workflow_data_ui for checkpoint ID: {checkpoint_id}")
@@ -810,7 +811,7 @@ async def download_model(request):
                                 self.file_name = fname
                                 self.file_size = max(int(fsize or 0), 0)
                                 self.progress = 0
-                                self.last_update_time = time.time()
+                                self.last_update_time = time.monotonic()
                                 self.last_downloaded = 0
                                 with download_lock:
                                     if download_id in download_progress:
@@ -820,7 +821,7 @@ async def download_model(request):
                             def update(self, size: int):
                                 try:
                                     self.progress += int(size or 0)
-                                    now = time.time()
+                                    now = time.monotonic()
                                     # Update global progress
                                     with download_lock:
                                         if download_id in download_progress:
@@ -1025,8 +1026,8 @@ async def model_suggests(request):
                 "message": "Missing required parameter: keyword"
             })
 
-        # 创建ModelScope网关实例
-        gateway = ModelScopeGateway()
+        # 复用共享的ModelScope网关实例
+        gateway = get_modelscope_gateway()
 
         suggests = gateway.search(name=keyword)
 
@@ -1,6 +1,7 @@
 from server import PromptServer
 from aiohttp import web
 from typing import Dict, Any
+import asyncio
 import logging
 from ..dao.expert_table import (
     create_rewrite_expert,
@@ -49,7 +50,8 @@ async def create_expert(request):
             return web.json_response({"success": False, "message": error_msg, "data": None}, status=400)
         
         # 创建专家记录
-        expert_id = create_rewrite_expert(
+        expert_id = await asyncio.to_thread(
+            create_rewrite_expert,
             name=validated_data['name'],
             description=validated_data['description'],
             content=validated_data['content']
@@ -67,7 +69,7 @@ async def create_expert(request):
 async def get_experts(request):
     """获取所有专家记录列表"""
     try:
-        experts = list_rewrite_experts()
+        experts = await asyncio.to_thread(list_rewrite_experts)
         
         logger.info(f"成功获取专家记录列表，共 {len(experts)} 条")
         
@@ -82,7 +84,7 @@ async def get_expert_by_id(request):
     """根据ID获取专家记录"""
     try:
         expert_id = int(request.match_info['expert_id'])
-        expert = get_rewrite_expert(expert_id)
+        expert = await asyncio.to_thread(get_rewrite_expert, expert_id)
         
         if not expert:
             return web.json_response({"success": False, "message": "ID不存在", "data": None}, status=404)
@@ -110,7 +112,8 @@ async def update_expert(request):
             return web.json_response({"success": False, "message": error_msg, "data": None}, status=400)
         
         # 更新专家记录
-        success = update_rewrite_expert_by_id(
+        success = await asyncio.to_thread(
+            update_rewrite_expert_by_id,
             expert_id=expert_id,
             name=validated_data.get('name'),
             description=validated_data.get('description'),
@@ -133,7 +136,7 @@ async def delete_expert(request):
     """删除专家记录"""
     try:
         expert_id = int(request.match_info['expert_id'])
-        success = delete_rewrite_expert_by_id(expert_id)
+        success = await asyncio.to_thread(delete_rewrite_expert_by_id, expert_id)
         
         if not success:
             return web.json_response({"success": False, "message": "ID不存在", "data": None}, status=404)
@@ -172,7 +175,8 @@ async def partial_update_expert(request):
             return web.json_response({"success": False, "message": "没有提供要更新的字段", "data": None}, status=400)
         
         # 更新专家记录
-        success = update_rewrite_expert_by_id(
+        success = await asyncio.to_thread(
+            update_rewrite_expert_by_id,
             expert_id=expert_id,
             **update_data
         )
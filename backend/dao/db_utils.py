@@ -0,0 +1,72 @@
+import json
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
+
+try:
+    # 用于加速workflow/消息等大JSON字段的读写；安装失败时回退到标准库json
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_DUMPS_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def create_sqlite_engine(db_path: str):
+    """创建复用连接并开启WAL的SQLite engine"""
+    engine = create_engine(
+        f'sqlite:///{db_path}',
+        echo=False,
+        # SQLAlchemy 1.4 对文件型SQLite默认使用NullPool，每个会话都重新打开连接；
+        # 改用连接池复用长连接（连接会在线程间传递，需关闭check_same_thread）
+        poolclass=QueuePool,
+        connect_args={'check_same_thread': False},
+    )
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            # WAL下读写互不阻塞，synchronous=NORMAL在WAL模式下仍可保证一致性且减少fsync
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def json_dumps(value: Any) -> str:
+    """序列化为JSON字符串，优先使用orjson（保留非ASCII字符）
+
+    注意：orjson会把NaN/Infinity写成null，标准库则写成NaN/Infinity
+    （前端JSON.stringify产生的workflow数据不会包含这些值）
+    """
+    if orjson is not None:
+        try:
+            # datetime/dataclass交给标准库处理（即抛出TypeError），与未安装orjson时行为一致
+            return orjson.dumps(value, option=_ORJSON_DUMPS_OPTIONS).decode('utf-8')
+        except TypeError:
+            # orjson不支持的值（如超出64位的整数、单独的代理字符）回退到标准库
+            pass
+    # 标准库保持默认的ensure_ascii=True：单独的代理字符（前端可能传来"\ud83d"）
+    # 无法编码为UTF-8，转义后才能写入SQLite
+    return json.dumps(value)
+
+
+def json_loads(value: str) -> Any:
+    """反序列化JSON字符串，优先使用orjson"""
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except ValueError:
+            # 标准库写入的NaN/Infinity等orjson不接受，回退到标准库
+            pass
+    return json.loads(value)
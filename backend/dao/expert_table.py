@@ -1,9 +1,11 @@
 import os
 import json
+import threading
 from typing import Dict, Any, Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, text
+from sqlalchemy import Column, Integer, String, DateTime, Text, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from .db_utils import create_sqlite_engine
 from datetime import datetime
 
 # 创建数据库基类
@@ -59,8 +61,11 @@ class DatabaseManager:
             db_path = os.path.join(db_dir, 'rewrite_expert.db')
         
         self.db_path = db_path
-        self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        self.engine = create_sqlite_engine(db_path)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # 专家列表读多写少（每次创建改写Agent都会读取），缓存在内存中，写操作后失效
+        self._experts_cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_lock = threading.Lock()
 
         # 创建表
         Base.metadata.create_all(bind=self.engine)
@@ -84,6 +89,7 @@ class DatabaseManager:
             )
             session.add(rewrite_expert)
             session.commit()
+            self._invalidate_cache()
             session.refresh(rewrite_expert)
             return rewrite_expert.id
         except Exception as e:
@@ -131,20 +137,20 @@ class DatabaseManager:
                 if not isinstance(items, list):
                     return
 
+            rows = [
+                {
+                    'name': entry.get('name'),
+                    'description': entry.get('description'),
+                    'content': entry.get('content'),
+                }
+                for entry in items
+                if entry.get('name')
+            ]
+
             session = self.get_session()
             try:
-                for entry in items:
-                    name = entry.get('name')
-                    if not name:
-                        continue
-                    description = entry.get('description')
-                    content = entry.get('content')
-                    expert = RewriteExpert(
-                        name=name,
-                        description=description,
-                        content=content
-                    )
-                    session.add(expert)
+                # 单事务内一次executemany批量写入，而不是逐个ORM对象INSERT
+                session.bulk_insert_mappings(RewriteExpert, rows)
                 session.commit()
             except Exception:
                 session.rollback()
@@ -164,23 +170,32 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def _invalidate_cache(self) -> None:
+        """写操作提交后清空专家列表缓存"""
+        with self._cache_lock:
+            self._experts_cache = None
+
+    def _get_all_experts(self) -> List[Dict[str, Any]]:
+        """获取所有专家记录（按ID正序），优先使用内存缓存"""
+        # 持锁查询，保证写操作的失效不会被并发读取写回的旧数据覆盖
+        with self._cache_lock:
+            if self._experts_cache is None:
+                session = self.get_session()
+                try:
+                    experts = session.query(RewriteExpert).order_by(RewriteExpert.id.asc()).all()
+                    self._experts_cache = [e.to_dict() for e in experts]
+                finally:
+                    session.close()
+            return self._experts_cache
+
     def list_rewrite_experts(self) -> List[Dict[str, Any]]:
         """获取所有专家记录，按ID倒序"""
-        session = self.get_session()
-        try:
-            experts = session.query(RewriteExpert).order_by(RewriteExpert.id.asc()).all()
-            return [e.to_dict() for e in experts]
-        finally:
-            session.close()
+        # 返回副本，避免调用方修改缓存内容
+        return [dict(e) for e in self._get_all_experts()]
     
     def list_rewrite_experts_short(self) -> List[Dict[str, Any]]:
         """获取所有专家记录，按ID倒序"""
-        session = self.get_session()
-        try:
-            experts = session.query(RewriteExpert).order_by(RewriteExpert.id.asc()).all()
-            return [{"name": e.name, "description": e.description} for e in experts]
-        finally:
-            session.close()
+        return [{"name": e["name"], "description": e["description"]} for e in self._get_all_experts()]
     
     def get_rewrite_expert_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """根据名称获取专家记录"""
@@ -216,6 +231,7 @@ class DatabaseManager:
                 expert.content = self._string_field(content)
 
             session.commit()
+            self._invalidate_cache()
             return True
         except Exception as e:
             session.rollback()
@@ -232,6 +248,7 @@ class DatabaseManager:
                 return False
             session.delete(expert)
             session.commit()
+            self._invalidate_cache()
             return True
         except Exception as e:
             session.rollback()
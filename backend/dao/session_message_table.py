@@ -8,11 +8,11 @@ Description: Session message table for conversation memory management with compr
 '''
 
 import os
-import json
 from typing import Dict, Any, Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from .db_utils import create_sqlite_engine, json_dumps, json_loads
 from datetime import datetime
 
 # 创建数据库基类
@@ -34,10 +34,10 @@ class SessionMessage(Base):
         return {
             'id': self.id,
             'session_id': self.session_id,
-            'messages': json.loads(self.messages) if self.messages else [],
+            'messages': json_loads(self.messages) if self.messages else [],
             'index': self.index,
             'summary': self.summary,
-            'attributes': json.loads(self.attributes) if self.attributes else None,
+            'attributes': json_loads(self.attributes) if self.attributes else None,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
@@ -53,7 +53,7 @@ class SessionMessageManager:
             db_path = os.path.join(db_dir, 'session_message.db')
         
         self.db_path = db_path
-        self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        self.engine = create_sqlite_engine(db_path)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         
         # 创建表
@@ -88,34 +88,40 @@ class SessionMessageManager:
         """保存或更新会话消息记录"""
         session = self.get_session()
         try:
-            # 查找是否已存在
-            record = session.query(SessionMessage)\
+            # 先直接UPDATE，按影响行数判断记录是否存在，不再为此加载整行（含较大的messages JSON）
+            values = {
+                SessionMessage.messages: json_dumps(messages),
+                SessionMessage.index: index,
+                SessionMessage.summary: summary,
+            }
+            if attributes:
+                values[SessionMessage.attributes] = json_dumps(attributes)
+            updated = session.query(SessionMessage)\
                 .filter(SessionMessage.session_id == session_id)\
-                .first()
-            
-            if record:
-                # 更新已有记录
-                record.messages = json.dumps(messages, ensure_ascii=False)
-                record.index = index
-                record.summary = summary
-                if attributes:
-                    record.attributes = json.dumps(attributes, ensure_ascii=False)
-                session.commit()
-                session.refresh(record)
-                return record.id
-            else:
-                # 创建新记录
-                new_record = SessionMessage(
-                    session_id=session_id,
-                    messages=json.dumps(messages, ensure_ascii=False),
-                    index=index,
-                    summary=summary,
-                    attributes=json.dumps(attributes, ensure_ascii=False) if attributes else None
-                )
-                session.add(new_record)
+                .update(values, synchronize_session=False)
+
+            if updated:
+                # 只取id列，session_id唯一索引即可覆盖，不读表行
+                record_id = session.query(SessionMessage.id)\
+                    .filter(SessionMessage.session_id == session_id)\
+                    .scalar()
                 session.commit()
-                session.refresh(new_record)
-                return new_record.id
+                return record_id
+
+            # 不存在则创建新记录
+            new_record = SessionMessage(
+                session_id=session_id,
+                messages=values[SessionMessage.messages],
+                index=index,
+                summary=summary,
+                attributes=values.get(SessionMessage.attributes)
+            )
+            session.add(new_record)
+            # flush后即可拿到自增id，避免commit后访问属性再次加载整行
+            session.flush()
+            record_id = new_record.id
+            session.commit()
+            return record_id
         except Exception as e:
             session.rollback()
             raise e
@@ -126,16 +132,12 @@ class SessionMessageManager:
         """更新指定session的摘要和索引"""
         session = self.get_session()
         try:
-            record = session.query(SessionMessage)\
+            # 单条UPDATE，按影响行数判断记录是否存在，省去先SELECT
+            updated = session.query(SessionMessage)\
                 .filter(SessionMessage.session_id == session_id)\
-                .first()
-            
-            if record:
-                record.summary = summary
-                record.index = index
-                session.commit()
-                return True
-            return False
+                .update({SessionMessage.summary: summary, SessionMessage.index: index}, synchronize_session=False)
+            session.commit()
+            return updated > 0
         except Exception as e:
             session.rollback()
             raise e
@@ -1,9 +1,9 @@
 import os
-import json
 from typing import Dict, Any, Optional
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from .db_utils import create_sqlite_engine, json_dumps, json_loads
 from datetime import datetime
 
 # 创建数据库基类
@@ -14,7 +14,7 @@ class WorkflowVersion(Base):
     __tablename__ = 'workflow_version'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    session_id = Column(String(255), nullable=False)
+    session_id = Column(String(255), nullable=False, index=True)  # 按session查询最新版本
     workflow_data = Column(Text, nullable=False)  # JSON字符串 api格式
     workflow_data_ui = Column(Text, nullable=True)  # JSON字符串 ui格式
     attributes = Column(Text, nullable=True)  # JSON字符串，存储额外属性
@@ -24,8 +24,8 @@ class WorkflowVersion(Base):
         return {
             'id': self.id,
             'session_id': self.session_id,
-            'workflow_data': json.loads(self.workflow_data) if self.workflow_data else None,
-            'attributes': json.loads(self.attributes) if self.attributes else None,
+            'workflow_data': json_loads(self.workflow_data) if self.workflow_data else None,
+            'attributes': json_loads(self.attributes) if self.attributes else None,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
@@ -41,11 +41,22 @@ class DatabaseManager:
             db_path = os.path.join(db_dir, 'workflow_debug.db')
         
         self.db_path = db_path
-        self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        self.engine = create_sqlite_engine(db_path)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         
         # 创建表
         Base.metadata.create_all(bind=self.engine)
+        # 已有库不会被create_all补建索引，这里单独检查创建
+        self._ensure_indexes()
+        
+    def _ensure_indexes(self) -> None:
+        """确保已有数据库中存在session_id索引（非破坏性升级）。"""
+        try:
+            for index in WorkflowVersion.__table__.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+        except Exception:
+            # 索引创建失败不影响正常读写
+            pass
         
     def get_session(self):
         """获取数据库会话"""
@@ -57,9 +68,9 @@ class DatabaseManager:
         try:
             workflow_version = WorkflowVersion(
                 session_id=session_id,
-                workflow_data=json.dumps(workflow_data),
-                workflow_data_ui=json.dumps(workflow_data_ui) if workflow_data_ui else None,
-                attributes=json.dumps(attributes) if attributes else None
+                workflow_data=json_dumps(workflow_data),
+                workflow_data_ui=json_dumps(workflow_data_ui) if workflow_data_ui else None,
+                attributes=json_dumps(attributes) if attributes else None
             )
             session.add(workflow_version)
             session.commit()
@@ -75,13 +86,14 @@ class DatabaseManager:
         """获取当前session的最新工作流数据（最大ID版本）"""
         session = self.get_session()
         try:
-            latest_version = session.query(WorkflowVersion)\
+            # 只查询需要的列，避免同时读取较大的workflow_data_ui/attributes
+            latest_version = session.query(WorkflowVersion.workflow_data)\
                 .filter(WorkflowVersion.session_id == session_id)\
                 .order_by(WorkflowVersion.id.desc())\
                 .first()
             
             if latest_version:
-                return json.loads(latest_version.workflow_data)
+                return json_loads(latest_version.workflow_data)
             return None
         finally:
             session.close()
@@ -90,13 +102,13 @@ class DatabaseManager:
         """获取当前session的最新工作流数据（最大ID版本）"""
         session = self.get_session()
         try:
-            latest_version = session.query(WorkflowVersion)\
+            latest_version = session.query(WorkflowVersion.workflow_data_ui)\
                 .filter(WorkflowVersion.session_id == session_id)\
                 .order_by(WorkflowVersion.id.desc())\
                 .first()
             
-            if latest_version:
-                return json.loads(latest_version.workflow_data_ui)
+            if latest_version and latest_version.workflow_data_ui:
+                return json_loads(latest_version.workflow_data_ui)
             return None
         finally:
             session.close() 
@@ -113,7 +125,7 @@ class DatabaseManager:
                 result = version.to_dict()
                 # 添加UI格式的工作流数据
                 if version.workflow_data_ui:
-                    result['workflow_data_ui'] = json.loads(version.workflow_data_ui)
+                    result['workflow_data_ui'] = json_loads(version.workflow_data_ui)
                 return result
             return None
         finally:
@@ -123,17 +135,15 @@ class DatabaseManager:
         """更新指定版本的工作流数据"""
         session = self.get_session()
         try:
-            version = session.query(WorkflowVersion)\
+            values = {WorkflowVersion.workflow_data: json_dumps(workflow_data)}
+            if attributes:
+                values[WorkflowVersion.attributes] = json_dumps(attributes)
+            # 单条UPDATE，按影响行数判断记录是否存在，省去先SELECT
+            updated = session.query(WorkflowVersion)\
                 .filter(WorkflowVersion.id == version_id)\
-                .first()
-            
-            if version:
-                version.workflow_data = json.dumps(workflow_data)
-                if attributes:
-                    version.attributes = json.dumps(attributes)
-                session.commit()
-                return True
-            return False
+                .update(values, synchronize_session=False)
+            session.commit()
+            return updated > 0
         except Exception as e:
             session.rollback()
             raise e
@@ -144,15 +154,11 @@ class DatabaseManager:
         """只更新指定版本的workflow_data_ui字段，不影响其他字段"""
         session = self.get_session()
         try:
-            version = session.query(WorkflowVersion)\
+            updated = session.query(WorkflowVersion)\
                 .filter(WorkflowVersion.id == version_id)\
-                .first()
-            
-            if version:
-                version.workflow_data_ui = json.dumps(workflow_data_ui)
-                session.commit()
-                return True
-            return False
+                .update({WorkflowVersion.workflow_data_ui: json_dumps(workflow_data_ui)}, synchronize_session=False)
+            session.commit()
+            return updated > 0
         except Exception as e:
             session.rollback()
             raise e
@@ -15,6 +15,7 @@ from ..dao.workflow_table import get_workflow_data, save_workflow_data
 from ..utils.request_context import get_session_id, get_config
 
 # Import ComfyUI internal modules
+import asyncio
 import uuid
 from ..utils.logger import log
 # Load environment variables from server.env
@@ -28,7 +29,7 @@ async def run_workflow() -> str:
         if not session_id:
             return json.dumps({"error": "No session_id found in context"})
             
-        workflow_data = get_workflow_data(session_id)
+        workflow_data = await asyncio.to_thread(get_workflow_data, session_id)
         if not workflow_data:
             return json.dumps({"error": "No workflow data found for this session"})
         
@@ -645,9 +646,10 @@ Start by validating the workflow to see its current state.""",
         # Save final workflow checkpoint after debugging completion
         debug_completion_checkpoint_id = None
         try:
-            current_workflow = get_workflow_data(session_id)
+            current_workflow = await asyncio.to_thread(get_workflow_data, session_id)
             if current_workflow:
-                debug_completion_checkpoint_id = save_workflow_data(
+                debug_completion_checkpoint_id = await asyncio.to_thread(
+                    save_workflow_data,
                     session_id, 
                     current_workflow,
                     workflow_data_ui=None,  # UI format not available here
@@ -739,5 +741,4 @@ async def test_debug():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(test_debug())
@@ -114,7 +114,8 @@ async def comfyui_agent_invoke(messages: List[Dict[str, Any]], images: List[Imag
         
         # Optimize messages with memory compression
         log.info(f"[MCP] Original messages count: {len(messages)}")
-        messages = message_memory_optimize(session_id, messages)
+        # Session-message DAO access and summary generation are blocking; keep them off the event loop
+        messages = await asyncio.to_thread(message_memory_optimize, session_id, messages)
         log.info(f"[MCP] Optimized messages count: {len(messages)}, messages: {messages}")
         
         # Create MCP server instances
@@ -1,7 +1,7 @@
 import json
 
 from agents.tool import function_tool
-from ..utils.modelscope_gateway import ModelScopeGateway
+from ..utils.modelscope_gateway import get_modelscope_gateway
 from ..utils.request_context import get_session_id
 
 from ..utils.comfy_gateway import get_object_info_by_class
@@ -310,8 +310,7 @@ async def get_model_files(model_type: str = "checkpoints") -> str:
 
 def suggest_model_download_by_modelscope(model_name_keyword: str) -> str:
     """建议下载缺失的模型，执行一次即可结束流程返回结果"""
-    modelscope_gateway = ModelScopeGateway()
-    return modelscope_gateway.suggest(name=model_name_keyword)
+    return get_modelscope_gateway().suggest(name=model_name_keyword)
 
 
 @function_tool
@@ -3,6 +3,7 @@
 import json
 import time
 import copy
+import heapq
 from typing import Dict, Any, Optional
 
 try:
@@ -226,6 +227,17 @@ async def search_node_local(node_class: str = "", keywords: list[str] = None, li
                 required_inputs = input_meta.get("required") or {}
                 optional_inputs = input_meta.get("optional") or {}
 
+            # 参数名、输出名每个节点只转换一次小写，而不是每个 token 都重复转换
+            params_lower: list[tuple[str, str]] = []
+            for section in (required_inputs, optional_inputs):
+                if isinstance(section, dict):
+                    for param_name in section.keys():
+                        p_str = str(param_name)
+                        params_lower.append((p_str, p_str.lower()))
+
+            output_names = meta.get("output_name") or []
+            outputs_lower = [str(out_name).lower() for out_name in output_names] if isinstance(output_names, list) else []
+
             # 针对每个 token 进行匹配和评分计算
             for token in tokens:
                 if not token:
@@ -238,20 +250,15 @@ async def search_node_local(node_class: str = "", keywords: list[str] = None, li
                         score += 2
 
                 # 方案2：按输入参数名搜索（brightness、contrast、saturation 等）
-                for section in (required_inputs, optional_inputs):
-                    if isinstance(section, dict):
-                        for param_name in section.keys():
-                            p_str = str(param_name)
-                            if token in p_str.lower():
-                                if p_str not in hit_params:
-                                    hit_params.append(p_str)
+                for p_str, p_lower in params_lower:
+                    if token in p_lower:
+                        if p_str not in hit_params:
+                            hit_params.append(p_str)
 
                 # 方案3：输出名称作为弱信号
-                output_names = meta.get("output_name") or []
-                if isinstance(output_names, list):
-                    for out_name in output_names:
-                        if token in str(out_name).lower():
-                            score += 1
+                for out_lower in outputs_lower:
+                    if token in out_lower:
+                        score += 1
 
             if hit_params:
                 # 参数命中整体提高权重
@@ -260,16 +267,8 @@ async def search_node_local(node_class: str = "", keywords: list[str] = None, li
             if score <= 0:
                 continue
 
-            candidates.append(
-                {
-                    "class_name": cls_str,
-                    "score": score,
-                    "hit_params": hit_params,
-                    "name": name,
-                    "display_name": display_name,
-                    "category": category,
-                }
-            )
+            # 先存轻量元组，只有最终返回的 limit 条才构造成 dict
+            candidates.append((score, cls_str, hit_params, name, display_name, category))
 
         if not candidates:
             return json.dumps(
@@ -283,10 +282,20 @@ async def search_node_local(node_class: str = "", keywords: list[str] = None, li
                 ensure_ascii=False,
             )
 
-        # 按得分排序，并限制返回数量
-        candidates.sort(key=lambda x: x["score"], reverse=True)
+        # 只取得分最高的 limit 条，无需对全部候选排序（结果与稳定排序后切片一致）
         limit = max(1, min(int(limit), 50))  # 给一个合理的上限
-        results = candidates[:limit]
+        results = [
+            {
+                "class_name": cls_str,
+                "score": score,
+                "hit_params": hit_params,
+                "name": name,
+                "display_name": display_name,
+                "category": category,
+            }
+            for score, cls_str, hit_params, name, display_name, category
+            in heapq.nlargest(limit, candidates, key=lambda x: x[0])
+        ]
 
         return json.dumps(
             {
@@ -6,34 +6,30 @@ import logging
 import logging.handlers
 import sys
 import os
-import inspect
 from datetime import datetime
 import io
+import queue
+import atexit
 
 
-class LocationFormatter(logging.Formatter):
-    """Custom formatter that adds file location information."""
-    
-    def format(self, record):
-        # Use location info if provided via extra, otherwise extract from record
-        if not hasattr(record, 'location'):
-            # Fallback: extract from record itself
-            filename = os.path.basename(record.pathname) if record.pathname else "unknown"
-            function_name = record.funcName if record.funcName else "unknown"
-            line_number = record.lineno if record.lineno else 0
-            record.location = f"{filename}:{function_name}:{line_number}"
-        
-        return super().format(record)
+_setup_done = False
 
 
 def setup_logger():
     """Setup the main logger with console and file handlers."""
+    global _setup_done
     # Create logger
     logger = logging.getLogger('comfyui_copilot')
+    if _setup_done:
+        return logger
+    
     logger.setLevel(logging.DEBUG)
+    # Don't hand records on to the host application's root handlers
+    logger.propagate = False
     
-    # Prevent duplicate logs
+    # Prevent duplicate logs if this module is imported a second time
     if logger.handlers:
+        _setup_done = True
         return logger
     
     # Console handler with safer encoding handling on Windows consoles
@@ -55,8 +51,8 @@ def setup_logger():
     console_handler.setLevel(logging.DEBUG)
     
     # Console formatter with colors (simple format for better compatibility)
-    console_format = '%(asctime)s | %(levelname)-8s | %(location)s | %(message)s'
-    console_formatter = LocationFormatter(console_format, datefmt='%Y-%m-%d %H:%M:%S')
+    console_format = '%(asctime)s | %(levelname)-8s | %(filename)s:%(funcName)s:%(lineno)d | %(message)s'
+    console_formatter = logging.Formatter(console_format, datefmt='%Y-%m-%d %H:%M:%S')
     console_handler.setFormatter(console_formatter)
     
     # File handler
@@ -72,110 +68,130 @@ def setup_logger():
     file_handler.setLevel(logging.DEBUG)
     
     # File formatter
-    file_format = '%(asctime)s | %(levelname)-8s | %(location)s | %(message)s'
-    file_formatter = LocationFormatter(file_format, datefmt='%Y-%m-%d %H:%M:%S')
+    file_format = '%(asctime)s | %(levelname)-8s | %(filename)s:%(funcName)s:%(lineno)d | %(message)s'
+    file_formatter = logging.Formatter(file_format, datefmt='%Y-%m-%d %H:%M:%S')
     file_handler.setFormatter(file_formatter)
     
+    # Callers only enqueue records; a background listener thread formats them and
+    # does the console/file I/O (including rotation) off the calling thread
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Drain pending records on interpreter shutdown
+    atexit.register(listener.stop)
+    
     # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
+    _setup_done = True
     return logger
 
 
+# Configure the shared 'comfyui_copilot' logger once at import; Logger instances
+# and the module-level functions below all reuse it
+_root_logger = setup_logger()
+
+
 class Logger:
     """Logger wrapper that provides convenient logging methods with automatic location detection."""
     
     def __init__(self, name=None):
-        self._logger = setup_logger()
         if name:
+            # Named loggers propagate to 'comfyui_copilot' and reuse its handlers
             self._logger = logging.getLogger(f'comfyui_copilot.{name}')
             self._logger.setLevel(logging.DEBUG)
-            # Prevent propagation to parent logger to avoid duplicate messages
-            self._logger.propagate = False
-            
-            # Copy handlers from parent logger if the named logger doesn't have any
-            if not self._logger.handlers:
-                parent_logger = logging.getLogger('comfyui_copilot')
-                for handler in parent_logger.handlers:
-                    self._logger.addHandler(handler)
-    
-    def _log_with_location(self, level, message, *args, **kwargs):
-        """Log message with automatic location detection."""
-        # Get the caller's frame (2 levels up: _log_with_location -> debug/info/etc -> actual caller)
-        frame = inspect.currentframe().f_back.f_back
-        try:
-            filename = os.path.basename(frame.f_code.co_filename)
-            function_name = frame.f_code.co_name
-            line_number = frame.f_lineno
-            
-            # Create a log record manually to ensure no duplicate processing
-            if self._logger.isEnabledFor(level):
-                record = self._logger.makeRecord(
-                    self._logger.name, level, frame.f_code.co_filename, line_number,
-                    message, args, None, function_name
-                )
-                record.location = f"{filename}:{function_name}:{line_number}"
-                
-                # Process the record through handlers directly to avoid duplication
-                for handler in self._logger.handlers:
-                    if record.levelno >= handler.level:
-                        handler.handle(record)
-        finally:
-            del frame
+        else:
+            self._logger = _root_logger
     
+    # Each method checks the level before building any call arguments, then hands
+    # straight to the stdlib logger; stacklevel=2 attributes the record to our caller
     def debug(self, message, *args, **kwargs):
         """Log debug message."""
-        self._log_with_location(logging.DEBUG, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(message, *args, stacklevel=2, **kwargs)
     
     def info(self, message, *args, **kwargs):
         """Log info message."""
-        self._log_with_location(logging.INFO, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(message, *args, stacklevel=2, **kwargs)
     
     def warning(self, message, *args, **kwargs):
         """Log warning message."""
-        self._log_with_location(logging.WARNING, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(message, *args, stacklevel=2, **kwargs)
     
     def warn(self, message, *args, **kwargs):
         """Log warning message (alias for warning)."""
-        self.warning(message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(message, *args, stacklevel=2, **kwargs)
     
     def error(self, message, *args, **kwargs):
         """Log error message."""
-        self._log_with_location(logging.ERROR, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(message, *args, stacklevel=2, **kwargs)
     
     def critical(self, message, *args, **kwargs):
         """Log critical message."""
-        self._log_with_location(logging.CRITICAL, message, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(message, *args, stacklevel=2, **kwargs)
     
     def exception(self, message, *args, **kwargs):
         """Log exception message with traceback."""
-        # For exceptions, we want to use the standard logger.exception which includes traceback
-        frame = inspect.currentframe().f_back
-        try:
-            filename = os.path.basename(frame.f_code.co_filename)
-            function_name = frame.f_code.co_name
-            line_number = frame.f_lineno
-            
-            # Use the standard exception logging with location info
-            self._logger.exception(message, *args, **kwargs, 
-                                 extra={'location': f"{filename}:{function_name}:{line_number}"},
-                                 stacklevel=2)
-        finally:
-            del frame
+        # error(exc_info=True) rather than logger.exception: before Python 3.11
+        # logger.exception adds its own frame, so stacklevel=2 would point here
+        kwargs.setdefault('exc_info', True)
+        self._logger.error(message, *args, stacklevel=2, **kwargs)
 
 
 # Create default logger instance
 log = Logger()
 
-# For backward compatibility and convenience
-debug = log.debug
-info = log.info
-warning = log.warning
-warn = log.warn
-error = log.error
-critical = log.critical
-exception = log.exception
+# Module-level convenience functions call the underlying stdlib logger directly,
+# skipping the bound-method hop through ``log``
+
+def debug(message, *args, **kwargs):
+    """Log debug message."""
+    if _root_logger.isEnabledFor(logging.DEBUG):
+        _root_logger.debug(message, *args, stacklevel=2, **kwargs)
+
+
+def info(message, *args, **kwargs):
+    """Log info message."""
+    if _root_logger.isEnabledFor(logging.INFO):
+        _root_logger.info(message, *args, stacklevel=2, **kwargs)
+
+
+def warning(message, *args, **kwargs):
+    """Log warning message."""
+    if _root_logger.isEnabledFor(logging.WARNING):
+        _root_logger.warning(message, *args, stacklevel=2, **kwargs)
+
+
+def warn(message, *args, **kwargs):
+    """Log warning message (alias for warning)."""
+    if _root_logger.isEnabledFor(logging.WARNING):
+        _root_logger.warning(message, *args, stacklevel=2, **kwargs)
+
+
+def error(message, *args, **kwargs):
+    """Log error message."""
+    if _root_logger.isEnabledFor(logging.ERROR):
+        _root_logger.error(message, *args, stacklevel=2, **kwargs)
+
+
+def critical(message, *args, **kwargs):
+    """Log critical message."""
+    if _root_logger.isEnabledFor(logging.CRITICAL):
+        _root_logger.critical(message, *args, stacklevel=2, **kwargs)
+
+
+def exception(message, *args, **kwargs):
+    """Log exception message with traceback."""
+    kwargs.setdefault('exc_info', True)
+    _root_logger.error(message, *args, stacklevel=2, **kwargs)
+
 
 # Allow creating named loggers
 def get_logger(name=None):
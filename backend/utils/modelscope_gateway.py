@@ -6,7 +6,9 @@ LastEditTime: 2025-09-01 19:31:03
 FilePath: /ComfyUI-Copilot/backend/utils/modelscope_gateway.py
 Description: 这是默认设置,请设置`customMade`, 打开koroFileHeader查看配置 进行设置: https://github.com/OBKoro1/koro1FileHeader/wiki/%E9%85%8D%E7%BD%AE
 '''
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -21,6 +23,11 @@ class ModelScopeGateway:
     SUGGEST_ENDPOINT = f"{BASE_URL}/api/v1/dolphin/model/suggestv2"
     SEARCH_ENDPOINT = f"{BASE_URL}/api/v1/dolphin/models"
     SEARCH_SINGLE_ENDPOINT = f"{BASE_URL}/api/v1/models"
+    # 单次 suggest 并发拉取模型详情的线程数
+    DETAIL_FETCH_WORKERS = 8
+    # 网关是进程内共享的单例，多个 suggest 可能同时进行；
+    # 连接池按 4 个并发请求预留，避免超出默认池大小（10）后连接被丢弃并告警 "pool is full"
+    POOL_MAXSIZE = DETAIL_FETCH_WORKERS * 4
     
     def __init__(self, timeout: float = 10.0, retries: int = 3, backoff: float = 0.5):
         self.timeout = timeout
@@ -41,7 +48,7 @@ class ModelScopeGateway:
             allowed_methods=["GET", "POST", "PUT"],
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_cfg)
+        adapter = HTTPAdapter(max_retries=retry_cfg, pool_maxsize=self.POOL_MAXSIZE)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -157,15 +164,18 @@ class ModelScopeGateway:
             log.error(f"ModelScope suggest failed: {body}, request: {payload}")
             return {"data": None}
         models = body['Data']['Model']['Suggests']
-        picked: List[Dict[str, Any]] = []
-        for item in models:
+
+        def fetch_detail(item: Any) -> Dict[str, Any]:
             base = item or {}
             inner = base.get('Model', {}) if isinstance(base, dict) else {}
             path = base.get('Path') or inner.get('Path')
             name = base.get('Name') or inner.get('Name')
-            detail= self.get_single_model(path, name)
-            data = self.formatData(detail or base)
-            picked.append(data)
+            detail = self.get_single_model(path, name)
+            return self.formatData(detail or base)
+
+        # 每个结果都要单独请求详情接口，并发请求而非逐条串行；map 保持原有顺序
+        with ThreadPoolExecutor(max_workers=min(self.DETAIL_FETCH_WORKERS, len(models))) as pool:
+            picked: List[Dict[str, Any]] = list(pool.map(fetch_detail, models))
         total = body['Data']['Model'].get('TotalCount') or body['Data']['Model'].get('Total') or 0
         return {"data": picked, "total": total}
 
@@ -310,6 +320,12 @@ class ModelScopeGateway:
             return False
 
 
+@functools.lru_cache(maxsize=None)
+def get_modelscope_gateway() -> ModelScopeGateway:
+    """获取共享的 ModelScopeGateway 实例：首次使用时才创建，之后复用同一个 Session 与连接池"""
+    return ModelScopeGateway()
+
+
 # 测试脚本入口
 if __name__ == "__main__":
     # 创建测试实例